@@ -1,50 +1,161 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+import functools
+import json
 import time
 import sys
 import random
+import tracemalloc
+import threading
+from array import array
+
+import sudoku_specialized
+from sudoku_cells import CELL_ROW, CELL_COL, CELL_BOX
+
+# Optional compiled Sudoku and maze solvers (need numba + numpy); pure Python otherwise
+try:
+    import sudoku_numba
+    import maze_numba
+except ImportError:
+    sudoku_numba = None
+    maze_numba = None
+
+# Optional C Sudoku solver (build with: python setup.py build_ext --inplace)
+try:
+    import sudoku_solver
+except ImportError:
+    sudoku_solver = None
 
 app = Flask(__name__)
 
 # ============================================================================
-# TOWER OF HANOI - DFS with Recursion
+# MEMORY PROFILING
 # ============================================================================
 
-def solve_hanoi_dfs(n, source, destination, auxiliary, path_moves):
+# tracemalloc traces the whole process, not one request, so only one request
+# at a time may own it. A profiled request that overlaps another one gets
+# memory_used = None rather than numbers mixed up with the other request's.
+# (Allocations made by other threads while tracing still count towards the
+# peak; this is a rough measurement, not an exact one.)
+_profile_lock = threading.Lock()
+
+def start_memory_profile(profile):
+    # Only trace allocations when the client asks for it ("profile": true),
+    # since tracing adds overhead to every allocation in the process
+    # Returns True if this request started tracing (pass it to stop_memory_profile)
+    if not profile or not _profile_lock.acquire(blocking=False):
+        return False
+    if tracemalloc.is_tracing():
+        # Already traced from outside the app (e.g. python -X tracemalloc)
+        _profile_lock.release()
+        return False
+    tracemalloc.start()
+    return True
+
+def stop_memory_profile(profiling):
+    # Peak memory allocated since start_memory_profile, formatted for the response
+    # Returns None when this request was not tracing
+    if not profiling:
+        return None
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    _profile_lock.release()
+    return f"{peak / (1024 * 1024):.4f} MB"
+
+# ============================================================================
+# TOWER OF HANOI - Iterative DFS
+# ============================================================================
+
+# Pegs are numbered 0, 1, 2 for A, B, C
+HANOI_PEGS = "ABC"
+
+# Largest disk count we keep move strings for (2^32 moves is far beyond
+# anything that could be solved or sent to a browser anyway)
+MAX_HANOI_DISKS = 32
+
+# MOVE_JSON[disk][src][dst] -> '"Move disk {disk} from {src} to {dst}"'
+# The move as a JSON string literal (quotes included), ready to stream
+# Built once at import so generating moves never formats a string
+MOVE_JSON = [
+    [
+        [sys.intern(f'"Move disk {disk} from {src} to {dst}"') if src != dst else None
+         for dst in HANOI_PEGS]
+        for src in HANOI_PEGS
+    ]
+    for disk in range(MAX_HANOI_DISKS + 1)
+]
+
+def hanoi_moves(n):
     """
-    Solves the Tower of Hanoi puzzle using Depth-First Search (recursive approach).
+    Generates the Tower of Hanoi solution, moving all disks from peg A to peg C.
     
-    The algorithm uses divide-and-conquer: to move N disks, we:
+    This produces exactly the same moves as the recursive DFS solution:
     1. Move N-1 disks to the auxiliary peg (out of the way)
     2. Move the largest disk to the destination
     3. Move those N-1 disks from auxiliary to destination
     
+    But instead of recursing, it uses the binary pattern of the move number:
+    for move i (counting from 1), the disk that moves is the position of the
+    lowest set bit of i, and the source and target pegs follow from i too.
+    One loop and a constant stack depth, even for large N.
+    
+    Moves are generated one at a time, so the full 2^N - 1 move list never
+    has to exist in memory.
+    
     Args:
         n: Number of disks to move
-        source: Starting peg (e.g., 'A')
-        destination: Target peg (e.g., 'C')
-        auxiliary: Helper peg (e.g., 'B')
-        path_moves: List that collects all moves as strings
+        
+    Yields:
+        (disk, src, dst) tuples, with pegs numbered 0, 1, 2 for A, B, C
     """
+    # The formula below cycles the tower from peg 0 to peg 2 when N is odd,
+    # and from peg 0 to peg 1 when N is even, so swap B and C for even N
+    pegs = (0, 1, 2) if n & 1 else (0, 2, 1)
+    
+    for i in range(1, 1 << n):
+        # Disk number = position of the lowest set bit of the move number
+        disk = (i & -i).bit_length()
+        yield disk, pegs[(i & (i - 1)) % 3], pegs[((i | (i - 1)) + 1) % 3]
+
+# The smallest disks are streamed as precomputed chunks of JSON; this many
+# disks per chunk gives chunks of 2^10 - 1 = 1023 moves
+HANOI_CHUNK_DISKS = 10
+
+@functools.lru_cache(maxsize=None)
+def hanoi_tower_json(k, src, dst):
+    # JSON for moving the k smallest disks as a tower from peg src to peg dst
+    # (comma separated move strings, without the surrounding brackets)
+    # hanoi_moves solves 0 -> 2 via 1, so relabel its pegs onto src -> dst
+    relabel = (src, 3 - src - dst, dst)
+    return ",".join(
+        MOVE_JSON[disk][relabel[s]][relabel[d]] for disk, s, d in hanoi_moves(k)
+    )
+
+def hanoi_solution_json(n):
+    """
+    Generates JSON chunks that together list every move for N disks.
     
-    # BASE CASE: If only 1 disk, move it directly
-    # This is the simplest problem we can solve without recursion
-    if n == 1:
-        path_moves.append(f"Move disk 1 from {source} to {destination}")
-        return
-    
-    # RECURSIVE STEP 1: Move top N-1 disks to auxiliary peg
-    # We use destination as temporary helper here
-    # This gets the smaller disks out of the way
-    solve_hanoi_dfs(n - 1, source, auxiliary, destination, path_moves)
-    
-    # STEP 2: Move the largest disk (disk N) to destination
-    # Now that smaller disks are out of the way, this is safe
-    path_moves.append(f"Move disk {n} from {source} to {destination}")
+    Moving N disks is the same as solving an (N - k + 1)-disk puzzle where
+    the k smallest disks are glued into one "super disk": whenever that super
+    disk moves, the real disks make a whole k-disk tower move. Those tower
+    moves only come in 6 peg combinations, so they are cached as ready-made
+    JSON and only the larger disks' moves are generated one by one.
     
-    # RECURSIVE STEP 3: Move those N-1 disks from auxiliary to destination
-    # We use source as temporary helper now (it's empty!)
-    # This completes the puzzle by stacking all disks on destination
-    solve_hanoi_dfs(n - 1, auxiliary, destination, source, path_moves)
+    Args:
+        n: Number of disks to move (0 to MAX_HANOI_DISKS; the route checks this)
+        
+    Yields:
+        Strings; joined, they form the items of a JSON array
+    """
+    k = min(n, HANOI_CHUNK_DISKS)
+    separator = ""
+    for disk, src, dst in hanoi_moves(n - k + 1):
+        if disk == 1:
+            # The super disk: a whole tower of the k smallest disks
+            yield separator + hanoi_tower_json(k, src, dst)
+        else:
+            # One of the larger disks, shifted up by the k - 1 extra disks
+            yield separator + MOVE_JSON[disk + k - 1][src][dst]
+        separator = ","
 
 def generate_hanoi_puzzle(num_disks):
     # For Tower of Hanoi, generating a "random" puzzle is just defining the number of disks.
@@ -58,142 +169,245 @@ def hanoi_page():
 @app.route('/generate_and_solve_hanoi', methods=['POST'])
 def generate_and_solve_hanoi():
     num_disks = int(request.json.get('num_disks', 10)) # Default to 10 disks for complexity
-    
-    start_time = time.time()
-    
-    path_moves = []
-    
-    # Measure memory usage (approximate for DFS recursion)
-    # This is a bit tricky for recursion directly. We'll capture sys.getsizeof for a representative structure.
-    # A more accurate way might involve custom memory profiling or analyzing the recursion depth.
-    initial_memory = sys.getsizeof(path_moves)
-    solve_hanoi_dfs(num_disks, 'A', 'C', 'B', path_moves)
-    final_memory = sys.getsizeof(path_moves)
-    
-    end_time = time.time()
-    
-    time_taken = (end_time - start_time) * 1000 # in milliseconds
-    memory_used = (final_memory - initial_memory) / (1024 * 1024) # in MB
-    
-    return jsonify({
-        "solution": path_moves,
-        "time_taken": f"{time_taken:.2f} ms",
-        "memory_used": f"{memory_used:.4f} MB"
-    })
+    profile = bool(request.json.get('profile', False)) # Measure peak memory of the solver
+    
+    # Reject bad disk counts with a JSON error before anything is streamed;
+    # once the 200 response has started there is no way to report a failure
+    if not 0 <= num_disks <= MAX_HANOI_DISKS:
+        return jsonify({"error": f"num_disks must be between 0 and {MAX_HANOI_DISKS}"}), 400
+    
+    # Time a pass that only generates the moves, so time_taken measures the
+    # solver and not how fast the response body can be sent and read
+    # perf_counter_ns: monotonic, high resolution, and an exact integer
+    start_time = time.perf_counter_ns()
+    
+    for _ in hanoi_solution_json(num_disks):
+        pass
+    
+    end_time = time.perf_counter_ns()
+    time_taken = (end_time - start_time) / 1e6 # in milliseconds
+    
+    # Measure memory usage (peak allocations while solving, if requested)
+    # on another generation-only pass, so tracing is never left running
+    # while the response body is being sent
+    profiling = start_memory_profile(profile)
+    try:
+        if profiling:
+            for _ in hanoi_solution_json(num_disks):
+                pass
+    finally:
+        memory_used = stop_memory_profile(profiling)
+    
+    # Stream the response: the moves are sent as they are generated, so memory
+    # use stays flat however many disks there are and the client can start
+    # receiving data right away. The metrics follow the moves.
+    def stream():
+        yield '{"solution": ['
+        yield from hanoi_solution_json(num_disks)
+        yield f'], "time_taken": "{time_taken:.2f} ms", "memory_used": {json.dumps(memory_used)}}}'
+    
+    return Response(stream(), mimetype='application/json')
 
 # ============================================================================
 # SUDOKU - DFS with Backtracking
 # ============================================================================
 
-def solve_sudoku_dfs(board):
+# The board is stored flat: cell (r, c) lives at index r * 9 + c.
+# CELL_ROW, CELL_COL and CELL_BOX (from sudoku_cells.py) give the row, column
+# and 3x3 box of every cell index, so the solver never divides in its hot loop.
+
+def build_sudoku_masks(board):
     """
-    Solves a Sudoku puzzle using Depth-First Search with backtracking.
+    Scans the Sudoku board once and records which digits are already used.
     
-    The algorithm tries numbers 1-9 in each empty cell. If a number works,
-    it recursively tries to solve the rest. If it hits a dead end, it
-    backtracks by undoing the last move and trying a different number.
+    Each row, column and 3x3 box gets one integer bitmask: bit v is set when
+    digit v (1-9) is already placed there. Checking a candidate then becomes a
+    couple of bitwise operations instead of rescanning 27 cells.
     
     Args:
-        board: 9x9 list of lists, where 0 represents an empty cell
+        board: Flat bytearray of 81 cells, where 0 represents an empty cell
         
     Returns:
-        True if puzzle is solved, False if no solution exists
+        Tuple (rows, cols, boxes, empties) where the first three are lists of
+        9 bitmasks and empties is the set of cell indices still to fill,
+        or None if a digit is given twice in one row, column or box
+    """
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    empties = set()
+    
+    for i, v in enumerate(board):
+        if v == 0:
+            # Remember this cell so the solver never has to search for it
+            empties.add(i)
+        else:
+            # Mark digit v as used in its row, column and box
+            bit = 1 << v
+            # Already used there: the clues contradict each other
+            if (rows[CELL_ROW[i]] | cols[CELL_COL[i]] | boxes[CELL_BOX[i]]) & bit:
+                return None
+            rows[CELL_ROW[i]] |= bit
+            cols[CELL_COL[i]] |= bit
+            boxes[CELL_BOX[i]] |= bit
+    
+    return rows, cols, boxes, empties
+
+def propagate_sudoku(board, rows, cols, boxes, empties, placed):
     """
+    Fills in every "naked single": an empty cell with only one legal digit left.
     
-    # Find the next empty cell (returns position or None)
-    find = find_empty(board)
+    Placing a single can leave other cells with a single option, so this keeps
+    sweeping until nothing changes. If some empty cell ends up with no legal
+    digit at all, or some row, column or box is missing a digit that fits in
+    none of its empty cells, the current board can't be completed and we stop
+    early.
     
-    # BASE CASE: No empty cells left means puzzle is solved!
-    if not find:
-        return True
-    else:
-        # Unpack the position of the empty cell
-        row, col = find
-
-    # TRY each number from 1 to 9 in this empty cell
-    for i in range(1, 10):
-        # Check if this number is valid according to Sudoku rules
-        if is_valid_sudoku_move(board, i, (row, col)):
-            # Valid move! Place the number on the board
-            board[row][col] = i
-
-            # RECURSIVE CALL: Try to solve the rest of the puzzle
-            # If this leads to a solution, we're done!
-            if solve_sudoku_dfs(board):
-                return True
-
-            # BACKTRACK: That didn't work, so undo this move
-            # Reset the cell to 0 and try the next number
-            board[row][col] = 0
-    
-    # If we tried all numbers 1-9 and none worked, return False
-    # This tells the previous recursion level to backtrack further
-    return False
-
-def find_empty(board):
-    """
-    Scans the Sudoku board to find the next empty cell.
+    The last sweep sees every remaining cell anyway, so it also remembers the
+    one with the fewest candidates for the solver to branch on next (MRV).
     
     Args:
-        board: 9x9 Sudoku grid
+        board, rows, cols, boxes, empties: Solver state (see solve_sudoku_dfs)
+        placed: List that collects the cells filled in here, so they can be undone
         
     Returns:
-        Tuple (row, col) of first empty cell, or None if board is full
+        None if a dead end was found, otherwise (cell, candidates) for the
+        most constrained empty cell, or (-1, 0) if the board is full
     """
-    # Loop through all rows
-    for r in range(9):
-        # Loop through all columns in this row
-        for c in range(9):
-            # If we find an empty cell (marked with 0), return its position
-            if board[r][c] == 0:
-                return (r, c)
-    
-    # No empty cells found - board is complete
-    return None
-
-def is_valid_sudoku_move(board, num, pos):
+    while True:
+        best_cell, best_cands, best_count = -1, 0, 10
+        changed = False
+        # Every digit a row/column/box still lacks must fit in one of its empty cells
+        row_room = rows[:]
+        col_room = cols[:]
+        box_room = boxes[:]
+        # Iterate over a copy, since filled cells are removed from empties
+        for i in list(empties):
+            r, c, b = CELL_ROW[i], CELL_COL[i], CELL_BOX[i]
+            # Digits used anywhere in this row, column or box are off limits.
+            # 0x3FE has bits 1-9 set, so this leaves exactly the legal digits.
+            cands = ~(rows[r] | cols[c] | boxes[b]) & 0x3FE
+            
+            # No digit fits here: this branch is a dead end
+            if cands == 0:
+                return None
+            
+            # Exactly one bit set: this digit is forced, so place it
+            if cands & (cands - 1) == 0:
+                board[i] = cands.bit_length() - 1
+                rows[r] ^= cands
+                cols[c] ^= cands
+                boxes[b] ^= cands
+                empties.remove(i)
+                placed.append(i)
+                changed = True
+            elif not changed:
+                # Track the most constrained cell in case this is the last sweep
+                count = cands.bit_count()
+                if count < best_count:
+                    best_cell, best_cands, best_count = i, cands, count
+                row_room[r] |= cands
+                col_room[c] |= cands
+                box_room[b] |= cands
+        
+        if not changed:
+            # If some unit has a missing digit that fits none of its empty
+            # cells, this branch is a dead end too
+            for k in range(9):
+                if (row_room[k] & col_room[k] & box_room[k]) != 0x3FE:
+                    return None
+            return best_cell, best_cands
+
+def undo_sudoku_placements(board, rows, cols, boxes, empties, placed):
+    # Take back the digits propagate_sudoku filled in, newest first
+    while placed:
+        i = placed.pop()
+        bit = 1 << board[i]
+        rows[CELL_ROW[i]] ^= bit
+        cols[CELL_COL[i]] ^= bit
+        boxes[CELL_BOX[i]] ^= bit
+        board[i] = 0
+        empties.add(i)
+
+def solve_sudoku_dfs(board, rows, cols, boxes, empties):
     """
-    Checks if placing a number at a position is valid according to Sudoku rules.
+    Solves a Sudoku puzzle using Depth-First Search with backtracking.
+    
+    The algorithm tries every digit still allowed in each empty cell. If a
+    digit works, it recursively tries to solve the rest. If it hits a dead end,
+    it backtracks by undoing the last move and trying a different digit.
+    
+    Used digits are tracked as bitmasks (see build_sudoku_masks), so the
+    candidates for a cell are simply the bits not set in its row, column or box.
     
-    Sudoku rules: No duplicates in the same row, column, or 3x3 box.
+    Instead of filling cells in reading order, each step picks the empty cell
+    with the fewest candidates left (the Minimum Remaining Values heuristic).
+    Branching on the most constrained cell first keeps the search tree small.
+    
+    Before branching, every forced cell is filled in (see propagate_sudoku),
+    and a branch is abandoned as soon as it is clearly a dead end.
     
     Args:
-        board: 9x9 Sudoku grid
-        num: Number to place (1-9)
-        pos: Position tuple (row, col)
+        board: Flat bytearray of 81 cells, where 0 represents an empty cell
+        rows, cols, boxes: Lists of 9 bitmasks of digits already used
+        empties: Set of cell indices that still need a digit
         
     Returns:
-        True if move is valid, False otherwise
+        True if puzzle is solved, False if no solution exists
     """
     
-    # CHECK ROW: Does this number already exist in this row?
-    for col in range(9):
-        # If we find the same number in this row (excluding the cell itself), invalid!
-        if board[pos[0]][col] == num and pos[1] != col:
-            return False
-
-    # CHECK COLUMN: Does this number already exist in this column?
-    for row in range(9):
-        # If we find the same number in this column (excluding the cell itself), invalid!
-        if board[row][pos[1]] == num and pos[0] != row:
-            return False
-
-    # CHECK 3x3 BOX: Does this number already exist in this box?
-    # First, figure out which box this cell belongs to (0, 1, or 2 for each dimension)
-    box_x = pos[1] // 3  # Column box number
-    box_y = pos[0] // 3  # Row box number
-
-    # Loop through all 9 cells in this 3x3 box
-    for r in range(box_y * 3, box_y * 3 + 3):
-        for c in range(box_x * 3, box_x * 3 + 3):
-            # If we find the same number in this box (excluding the cell itself), invalid!
-            if board[r][c] == num and (r, c) != pos:
-                return False
-    
-    # Passed all three checks! This move is valid
-    return True
+    # PROPAGATE: Fill in forced cells first, and give up early on a dead end
+    placed = []
+    choice = propagate_sudoku(board, rows, cols, boxes, empties, placed)
+    if choice is None:
+        undo_sudoku_placements(board, rows, cols, boxes, empties, placed)
+        return False
+    
+    # BASE CASE: Every empty cell has been filled means puzzle is solved!
+    if not empties:
+        return True
+    
+    # CHOOSE the empty cell with the fewest legal digits (MRV),
+    # which propagation already found on its final sweep
+    cell, candidates = choice
+    row, col, box = CELL_ROW[cell], CELL_COL[cell], CELL_BOX[cell]
+    
+    # Take this cell out of the pool while we try digits in it
+    empties.remove(cell)
+    
+    # TRY each legal digit, lowest first
+    while candidates:
+        # Isolate the lowest set bit and turn it back into a digit
+        bit = candidates & -candidates
+        candidates ^= bit
+        
+        # Valid move! Place the digit and mark it used
+        board[cell] = bit.bit_length() - 1
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+        
+        # RECURSIVE CALL: Try to solve the rest of the puzzle
+        # If this leads to a solution, we're done!
+        if solve_sudoku_dfs(board, rows, cols, boxes, empties):
+            return True
+        
+        # BACKTRACK: That didn't work, so undo this move
+        # Clear the bit again and try the next digit
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+    
+    # If no digit worked, reset the cell, hand it back to the pool and undo
+    # the forced cells from this level too
+    # Returning False tells the previous recursion level to backtrack further
+    board[cell] = 0
+    empties.add(cell)
+    undo_sudoku_placements(board, rows, cols, boxes, empties, placed)
+    return False
 
-def generate_sudoku_puzzle(difficulty=50): # difficulty is how many cells to remove (higher = harder)
+def generate_sudoku_puzzle(difficulty=50, rng=random): # difficulty is how many cells to remove (higher = harder)
+    # rng: the random module, or a random.Random(seed) for a repeatable puzzle
     # Start with a solved Sudoku (can be fixed or randomly generated and solved)
     base_board = [
         [3, 1, 6, 5, 7, 8, 4, 9, 2],
@@ -210,19 +424,67 @@ def generate_sudoku_puzzle(difficulty=50): # difficulty is how many cells to rem
     # then randomly remove cells ensuring a unique solution.
     # This example uses a fixed base and removes cells.
 
-    puzzle_board = [row[:] for row in base_board] # Deep copy
+    puzzle_board = bytearray(sum(base_board, [])) # Flatten into 81 cells
     
     # Remove cells
     cells_removed = 0
     while cells_removed < difficulty:
-        row = random.randint(0, 8)
-        col = random.randint(0, 8)
-        if puzzle_board[row][col] != 0:
-            puzzle_board[row][col] = 0
+        row = rng.randint(0, 8)
+        col = rng.randint(0, 8)
+        if puzzle_board[row * 9 + col] != 0:
+            puzzle_board[row * 9 + col] = 0
             cells_removed += 1
     
     return puzzle_board
 
+@functools.lru_cache(maxsize=256)
+def cached_sudoku_puzzle(difficulty, seed):
+    # Same seed and difficulty -> same puzzle, generated only once
+    # Stored as immutable bytes so no request can modify the cached copy
+    # A private Random(seed) keeps the module-level random state untouched,
+    # so concurrent unseeded requests neither disturb nor share this stream
+    return bytes(generate_sudoku_puzzle(difficulty, random.Random(seed)))
+
+def solve_sudoku(board, specialized=False):
+    """
+    Solves a flat Sudoku board in place with the fastest available solver.
+    
+    Uses the C extension (sudoku_solver.c) when it has been built, then the
+    Numba-compiled solver from sudoku_numba.py when numba is installed, and
+    the pure Python solve_sudoku_dfs otherwise.
+    
+    Every solver starts by rejecting boards that can't be solved (a digit
+    given twice in one row, column or box, or an empty cell with no legal
+    digit left), so the answer never depends on which one is installed.
+    
+    Args:
+        board: Flat bytearray of 81 cells, where 0 represents an empty cell
+        specialized: Use the solver generated for this clue pattern
+            (sudoku_specialized.py) instead; worthwhile when the same
+            pattern is solved many times
+        
+    Returns:
+        True if puzzle is solved, False if no solution exists
+    """
+    if specialized:
+        return sudoku_specialized.solve_sudoku(board)
+    
+    if sudoku_solver is not None:
+        return sudoku_solver.solve(board)
+    
+    if sudoku_numba is not None:
+        return sudoku_numba.solve_sudoku(board)
+    
+    masks = build_sudoku_masks(board)
+    if masks is None:
+        return False
+    # An empty cell with no legal digit is caught by the first propagation step
+    return solve_sudoku_dfs(board, *masks)
+
+def sudoku_board_to_rows(board):
+    # The frontend expects a 9x9 list of lists, so unflatten for the JSON response
+    return [list(board[r * 9:r * 9 + 9]) for r in range(9)]
+
 @app.route('/sudoku')
 def sudoku_page():
     return render_template('sudoku.html')
@@ -230,77 +492,127 @@ def sudoku_page():
 @app.route('/generate_and_solve_sudoku', methods=['POST'])
 def generate_and_solve_sudoku():
     difficulty = int(request.json.get('difficulty', 60)) # More cells removed = harder
+    specialized = bool(request.json.get('specialized', False)) # Use the clue-pattern specialized solver
+    profile = bool(request.json.get('profile', False)) # Measure peak memory of the solver
+    seed = request.json.get('seed') # Optional: same seed -> same puzzle
     
-    puzzle = generate_sudoku_puzzle(difficulty)
-    board_to_solve = [row[:] for row in puzzle] # Make a copy for solving
-
-    start_time = time.time()
-    
-    # Measure memory usage for the board representation
-    initial_memory = sys.getsizeof(board_to_solve) + sum(sys.getsizeof(row) for row in board_to_solve)
-    
-    success = solve_sudoku_dfs(board_to_solve)
-    
-    final_memory = sys.getsizeof(board_to_solve) + sum(sys.getsizeof(row) for row in board_to_solve)
-    
-    end_time = time.time()
-    
-    time_taken = (end_time - start_time) * 1000 # in milliseconds
-    memory_used = (final_memory - initial_memory) / (1024 * 1024) # in MB
+    if seed is None:
+        puzzle = generate_sudoku_puzzle(difficulty)
+    else:
+        try:
+            seed = int(seed)
+        except (TypeError, ValueError):
+            return jsonify({"error": "seed must be an integer"}), 400
+        puzzle = cached_sudoku_puzzle(difficulty, seed)
+    board_to_solve = bytearray(puzzle) # Make a copy for solving
+
+    # perf_counter_ns: monotonic, high resolution, and an exact integer
+    start_time = time.perf_counter_ns()
+    
+    success = solve_sudoku(board_to_solve, specialized)
+    
+    end_time = time.perf_counter_ns()
+    time_taken = (end_time - start_time) / 1e6 # in milliseconds
+    
+    # Measure memory usage (peak allocations while solving, if requested) on
+    # a separate solve of a fresh copy, so tracing never slows the timed run
+    profiling = start_memory_profile(profile)
+    try:
+        if profiling:
+            solve_sudoku(bytearray(puzzle), specialized)
+    finally:
+        memory_used = stop_memory_profile(profiling)
     
     return jsonify({
-        "puzzle": puzzle,
-        "solution": board_to_solve if success else "No solution found",
+        "puzzle": sudoku_board_to_rows(puzzle),
+        "solution": sudoku_board_to_rows(board_to_solve) if success else "No solution found",
         "time_taken": f"{time_taken:.2f} ms",
-        "memory_used": f"{memory_used:.4f} MB",
+        "memory_used": memory_used,
         "success": success
     })
 
 # --- Maze ---
-def generate_maze(width, height):
+def generate_maze(width, height, rng=random):
+    # rng: the random module, or a random.Random(seed) for a repeatable maze
     # Implement a maze generation algorithm (e.g., Kruskal's, Prim's, Recursive Backtracker)
     # For simplicity, let's start with a basic grid of walls and paths.
     # A more complex generator would ensure a single path from start to end.
     
-    # Initialize grid with all walls
-    maze = [[1 for _ in range(width)] for _ in range(height)] # 1 = wall, 0 = path
+    # Initialize grid with all walls, stored flat: cell (y, x) is maze[y * width + x]
+    maze = bytearray(b'\x01' * (width * height)) # 1 = wall, 0 = path
+    
+    # Recursive backtracking maze generator, run with an explicit stack
+    # so large mazes don't hit Python's recursion limit
+    directions = [(0, -2), (0, 2), (-2, 0), (2, 0)] # Up, Down, Left, Right (2 steps to avoid immediate loops)
+    
+    # Start carving from a random point (must be odd coordinates for the 2-step approach)
+    start_x, start_y = rng.randrange(1, width, 2), rng.randrange(1, height, 2)
+    maze[start_y * width + start_x] = 0
+    dirs = directions[:]
+    rng.shuffle(dirs)
     
-    # Simple recursive backtracking maze generator
-    def carve_path(cx, cy):
-        maze[cy][cx] = 0 # Carve current cell
-        directions = [(0, -2), (0, 2), (-2, 0), (2, 0)] # Up, Down, Left, Right (2 steps to avoid immediate loops)
-        random.shuffle(directions)
+    # Each stack entry is (x, y, directions left to try), standing in for one recursive call
+    stack = [(start_x, start_y, iter(dirs))]
+    while stack:
+        cx, cy, dirs = stack[-1]
         
-        for dx, dy in directions:
+        # Resume trying directions from the cell on top of the stack
+        for dx, dy in dirs:
             nx, ny = cx + dx, cy + dy
-            if 0 <= nx < width and 0 <= ny < height and maze[ny][nx] == 1:
-                maze[cy + dy // 2][cx + dx // 2] = 0 # Carve wall between
-                carve_path(nx, ny)
-                
-    # Start carving from a random point (must be odd coordinates for the 2-step approach)
-    start_x, start_y = random.randrange(1, width, 2), random.randrange(1, height, 2)
-    carve_path(start_x, start_y)
+            if 0 <= nx < width and 0 <= ny < height and maze[ny * width + nx] == 1:
+                maze[(cy + dy // 2) * width + cx + dx // 2] = 0 # Carve wall between
+                maze[ny * width + nx] = 0 # Carve the new cell
+                dirs = directions[:]
+                rng.shuffle(dirs)
+                stack.append((nx, ny, iter(dirs)))
+                break
+        else:
+            # Dead end: every direction has been tried, backtrack
+            stack.pop()
     
     # Ensure start and end points (can be fixed or randomly chosen)
-    maze[1][1] = 0 # Start
-    maze[height - 2][width - 2] = 0 # End
+    maze[1 * width + 1] = 0 # Start
+    maze[(height - 2) * width + width - 2] = 0 # End
     
     return maze
 
+def maze_to_rows(maze, width):
+    # The frontend expects a list of rows, so unflatten for the JSON response
+    return [list(maze[i:i + width]) for i in range(0, len(maze), width)]
+
 # ============================================================================
 # MAZE SOLVER - DFS with Explicit Stack
 # ============================================================================
 
-def solve_maze_dfs(maze, start, end):
+def pad_maze(maze, width, height):
+    # Copy of the flat maze with one extra ring of walls all around it:
+    # (width + 2) * (height + 2) cells, where maze cell (r, c) sits at (r + 1, c + 1)
+    padded_width = width + 2
+    padded = bytearray(b'\x01' * (padded_width * (height + 2)))
+    for r in range(height):
+        start = (r + 1) * padded_width + 1
+        padded[start:start + width] = maze[r * width:(r + 1) * width]
+    return padded
+
+def solve_maze_dfs(maze, width, height, start, end):
     """
     Solves a maze using Depth-First Search with an explicit stack.
     
     The algorithm explores paths by always going as deep as possible before
-    backtracking. It uses a stack to track positions to explore and a set
-    to remember visited cells (avoiding cycles).
+    backtracking. It uses a stack to track positions to explore and a visited
+    bitmap to remember cells already discovered (avoiding cycles).
+    
+    Instead of carrying a copy of the path with every stack entry, it records
+    the parent of each cell it discovers and rebuilds the path once at the end.
+    
+    Cells are handled as flat indices (row * width + col), so moving to a
+    neighbor is just adding an offset. The maze is padded with a border of
+    walls first, so no step ever needs a separate bounds check.
     
     Args:
-        maze: 2D grid where 0 = path, 1 = wall
+        maze: Flat bytearray of width * height cells, where 0 = path, 1 = wall
+        width: Number of columns in the maze
+        height: Number of rows in the maze
         start: Starting position tuple (row, col)
         end: Goal position tuple (row, col)
         
@@ -308,56 +620,92 @@ def solve_maze_dfs(maze, start, end):
         List of positions from start to end, or None if no path exists
     """
     
-    # Get maze dimensions for boundary checking
-    rows, cols = len(maze), len(maze[0])
+    # Work on a copy of the maze surrounded by a permanent wall border, so a
+    # step off the edge always lands on a wall: one maze[ni] == 0 test covers
+    # both "inside the grid" and "not a wall"
+    grid = pad_maze(maze, width, height)
+    padded_width = width + 2
+    
+    # Convert start and end to flat indices in the padded grid
+    start_i = (start[0] + 1) * padded_width + start[1] + 1
+    end_i = (end[0] + 1) * padded_width + end[1] + 1
     
-    # Initialize stack with starting position and path
-    # Stack stores tuples of (current_position, path_to_get_here)
-    # Starting path contains just the start position
-    stack = [(start, [start])]
+    # Neighbor offsets in the flat grid: Right, Left, Down, Up
+    neighbors = (1, -1, padded_width, -padded_width)
+    
+    # Initialize stack with just the starting position
+    stack = [start_i]
+    
+    # Remember how we reached each cell: parent[cell] is the cell we came from
+    # A flat int array (one slot per cell) instead of a dict, so recording a
+    # parent stores a machine int rather than allocating a dict entry
+    # The start has no parent (-1), which tells us where to stop when rebuilding
+    parent = array('i', [-1]) * len(grid)
     
     # Track visited cells to avoid going in circles
-    # Using a set for O(1) lookup time
-    visited = set()
+    # One bit per cell: cell i is bit (i & 7) of byte (i >> 3)
+    # Cells are marked when pushed, so each one enters the stack only once
+    visited = bytearray((len(grid) + 7) >> 3)
+    visited[start_i >> 3] |= 1 << (start_i & 7)
 
     # MAIN LOOP: Continue while there are positions to explore
     while stack:
         # Pop the most recent position from stack (this makes it depth-first!)
-        # Unpack into current position and the path taken to get here
-        (r, c), path = stack.pop()
-
-        # SUCCESS! We've reached the goal - return the winning path
-        if (r, c) == end:
+        i = stack.pop()
+
+        # SUCCESS! We've reached the goal - walk the parents back to the start
+        if i == end_i:
+            path = []
+            cur = end_i
+            while cur != -1:
+                # Undo the padding: padded (r + 1, c + 1) is maze cell (r, c)
+                r, c = divmod(cur, padded_width)
+                path.append((r - 1, c - 1))
+                cur = parent[cur]
+            path.reverse()
             return path
 
-        # Skip if we've already visited this cell
-        # This prevents infinite loops
-        if (r, c) in visited:
-            continue
-        
-        # Mark this cell as visited
-        visited.add((r, c))
-
         # EXPLORE ALL FOUR NEIGHBORS (Right, Left, Down, Up)
-        # Each tuple (dr, dc) represents a direction offset
-        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+        for d in neighbors:
             # Calculate neighbor's position
-            nr, nc = r + dr, c + dc
+            ni = i + d
             
             # Check if this neighbor is valid:
-            # 1. Within maze boundaries (0 <= nr < rows and 0 <= nc < cols)
-            # 2. Is a path, not a wall (maze[nr][nc] == 0)
-            # 3. Haven't visited it yet ((nr, nc) not in visited)
-            if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0 and (nr, nc) not in visited:
-                # Add this neighbor to stack for future exploration
-                # Create new path that includes all previous positions plus this neighbor
-                # Note: path + [(nr, nc)] creates a new list without modifying original
-                stack.append(((nr, nc), path + [(nr, nc)]))
+            # 1. Is a path, not a wall or the border (grid[ni] == 0)
+            # 2. Haven't visited it yet (its bit is still 0)
+            if grid[ni] == 0 and not visited[ni >> 3] & (1 << (ni & 7)):
+                # Mark it, add it to stack for future exploration
+                # and remember that we got there from cell i
+                visited[ni >> 3] |= 1 << (ni & 7)
+                parent[ni] = i
+                stack.append(ni)
     
     # Exhausted all possibilities without reaching the end
     # No solution exists
     return None
 
+def make_maze(width, height, rng=random):
+    # Use the Numba-compiled generator from maze_numba.py when available
+    if maze_numba is not None:
+        return maze_numba.generate_maze(width, height, rng)
+    return generate_maze(width, height, rng)
+
+# Only mazes up to this many cells are cached: the cache holds 256 entries,
+# so this bounds it at 16 MB however large the requested mazes are
+MAX_CACHED_MAZE_CELLS = 256 * 256
+
+@functools.lru_cache(maxsize=256)
+def cached_maze(width, height, seed):
+    # Same seed and size -> same maze, generated only once (as immutable bytes)
+    # drawn from a private Random(seed), not the shared module-level state
+    return bytes(make_maze(width, height, random.Random(seed)))
+
+def solve_maze(maze, width, height, start, end):
+    # Use the Numba-compiled solver from maze_numba.py when available
+    if maze_numba is not None:
+        return maze_numba.solve_maze(maze, width, height, start, end)
+    return solve_maze_dfs(maze, width, height, start, end)
+
 @app.route('/maze')
 def maze_page():
     return render_template('maze.html')
@@ -366,34 +714,50 @@ def maze_page():
 def generate_and_solve_maze():
     width = int(request.json.get('width', 31)) # Must be odd for current generator
     height = int(request.json.get('height', 31)) # Must be odd
+    profile = bool(request.json.get('profile', False)) # Measure peak memory of the solver
 
     if width % 2 == 0: width += 1
     if height % 2 == 0: height += 1
     
-    maze = generate_maze(width, height)
+    seed = request.json.get('seed') # Optional: same seed -> same maze
+    if seed is None:
+        maze = make_maze(width, height)
+    else:
+        try:
+            seed = int(seed)
+        except (TypeError, ValueError):
+            return jsonify({"error": "seed must be an integer"}), 400
+        if width * height <= MAX_CACHED_MAZE_CELLS:
+            maze = bytearray(cached_maze(width, height, seed)) # Fresh copy per request
+        else:
+            # Too big to keep around: generate it the same way, uncached
+            maze = make_maze(width, height, random.Random(seed))
     
     start_pos = (1, 1) # Example start
     end_pos = (height - 2, width - 2) # Example end
 
-    start_time = time.time()
-    
-    # Measure memory usage (approximate for stack and visited set)
-    initial_memory = sys.getsizeof(maze) + sys.getsizeof(start_pos) + sys.getsizeof(end_pos)
-    
-    solution_path = solve_maze_dfs(maze, start_pos, end_pos)
+    # perf_counter_ns: monotonic, high resolution, and an exact integer
+    start_time = time.perf_counter_ns()
     
-    final_memory = sys.getsizeof(maze) + sys.getsizeof(start_pos) + sys.getsizeof(end_pos) + sys.getsizeof(solution_path) + sys.getsizeof(set()) # Add visited set approx
+    solution_path = solve_maze(maze, width, height, start_pos, end_pos)
     
-    end_time = time.time()
+    end_time = time.perf_counter_ns()
+    time_taken = (end_time - start_time) / 1e6 # in milliseconds
     
-    time_taken = (end_time - start_time) * 1000 # in milliseconds
-    memory_used = (final_memory - initial_memory) / (1024 * 1024) # in MB
+    # Measure memory usage (peak allocations while solving, if requested) on
+    # a separate solve, so tracing never slows the timed run
+    profiling = start_memory_profile(profile)
+    try:
+        if profiling:
+            solve_maze(maze, width, height, start_pos, end_pos)
+    finally:
+        memory_used = stop_memory_profile(profiling)
     
     return jsonify({
-        "maze": maze,
+        "maze": maze_to_rows(maze, width),
         "solution_path": solution_path,
         "time_taken": f"{time_taken:.2f} ms",
-        "memory_used": f"{memory_used:.4f} MB"
+        "memory_used": memory_used
     })
 
 # --- Main Route ---
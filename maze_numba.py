@@ -0,0 +1,179 @@
+"""
+Numba-compiled versions of the maze generator and DFS maze solver.
+
+These follow generate_maze and solve_maze_dfs in app.py step for step (the
+stack-based recursive backtracker, and DFS with parent pointers and a
+visited bitmap), but work on a numpy uint8 view of the flat maze with
+preallocated int32 stacks, so the inner loops compile down to plain integer
+operations with no Python objects allocated per cell. One difference: the
+compiled solver checks the grid edges directly instead of padding the maze
+with a wall border, since native compares are cheaper than the extra copy.
+
+Numba and numpy are optional: app.py falls back to the pure Python versions
+when they are not installed.
+"""
+
+import random
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _carve(maze, width, height, start_x, start_y, seed):
+    """Carves passages into an all-wall maze with an explicit DFS stack."""
+    np.random.seed(seed)
+
+    # Up, Down, Left, Right (2 steps to avoid immediate loops)
+    dx = np.array([0, 0, -2, 2], dtype=np.int32)
+    dy = np.array([-2, 2, 0, 0], dtype=np.int32)
+
+    # One frame per carved cell: its position, shuffled directions and how
+    # many of them have been tried so far
+    capacity = ((width + 1) // 2) * ((height + 1) // 2)
+    stack_x = np.empty(capacity, dtype=np.int32)
+    stack_y = np.empty(capacity, dtype=np.int32)
+    order = np.empty((capacity, 4), dtype=np.int32)
+    tried = np.zeros(capacity, dtype=np.int32)
+
+    maze[start_y * width + start_x] = 0
+    stack_x[0] = start_x
+    stack_y[0] = start_y
+    order[0] = np.random.permutation(4)
+    top = 0
+
+    while top >= 0:
+        cx = stack_x[top]
+        cy = stack_y[top]
+
+        moved = False
+        while tried[top] < 4:
+            d = order[top, tried[top]]
+            tried[top] += 1
+            nx = cx + dx[d]
+            ny = cy + dy[d]
+            if 0 <= nx < width and 0 <= ny < height and maze[ny * width + nx] == 1:
+                maze[(cy + dy[d] // 2) * width + cx + dx[d] // 2] = 0
+                maze[ny * width + nx] = 0
+                top += 1
+                stack_x[top] = nx
+                stack_y[top] = ny
+                order[top] = np.random.permutation(4)
+                tried[top] = 0
+                moved = True
+                break
+
+        # Dead end: every direction has been tried, backtrack
+        if not moved:
+            top -= 1
+
+
+@njit(cache=True)
+def _solve(maze, width, height, start_i, end_i, parent, stack):
+    """DFS from start_i; fills parent[] and returns True if end_i is reached."""
+    visited = np.zeros((width * height + 7) >> 3, dtype=np.uint8)
+    visited[start_i >> 3] |= 1 << (start_i & 7)
+    parent[start_i] = -1
+    stack[0] = start_i
+    top = 0
+
+    while top >= 0:
+        i = stack[top]
+        top -= 1
+
+        if i == end_i:
+            return True
+
+        r = i // width
+        c = i % width
+
+        # Right, Left, Down, Up, skipping steps that would leave the grid
+        for k in range(4):
+            if k == 0:
+                if c >= width - 1:
+                    continue
+                ni = i + 1
+            elif k == 1:
+                if c <= 0:
+                    continue
+                ni = i - 1
+            elif k == 2:
+                if r >= height - 1:
+                    continue
+                ni = i + width
+            else:
+                if r <= 0:
+                    continue
+                ni = i - width
+
+            bit = 1 << (ni & 7)
+            if maze[ni] == 0 and not visited[ni >> 3] & bit:
+                visited[ni >> 3] |= bit
+                parent[ni] = i
+                top += 1
+                stack[top] = ni
+
+    return False
+
+
+def generate_maze(width, height, rng=random):
+    """
+    Generates a random maze with the compiled carver.
+
+    Args:
+        width: Number of columns (odd)
+        height: Number of rows (odd)
+        rng: Source of randomness: the random module, or a random.Random(seed)
+            for a repeatable maze
+
+    Returns:
+        Flat bytearray of width * height cells, where 0 = path, 1 = wall
+    """
+    maze = bytearray(b'\x01' * (width * height))
+    grid = np.frombuffer(maze, dtype=np.uint8)
+
+    # Draw the start cell and the kernel's seed from rng, so seeding rng
+    # makes the whole maze reproducible
+    start_x, start_y = rng.randrange(1, width, 2), rng.randrange(1, height, 2)
+    _carve(grid, width, height, start_x, start_y, rng.getrandbits(32))
+
+    # Ensure start and end points
+    maze[1 * width + 1] = 0
+    maze[(height - 2) * width + width - 2] = 0
+
+    return maze
+
+
+def solve_maze(maze, width, height, start, end):
+    """
+    Solves a flat maze with the compiled DFS solver.
+
+    Args:
+        maze: Flat bytearray of width * height cells, where 0 = path, 1 = wall
+        width: Number of columns in the maze
+        height: Number of rows in the maze
+        start: Starting position tuple (row, col)
+        end: Goal position tuple (row, col)
+
+    Returns:
+        List of positions from start to end, or None if no path exists
+    """
+    grid = np.frombuffer(maze, dtype=np.uint8)
+    start_i = start[0] * width + start[1]
+    end_i = end[0] * width + end[1]
+
+    # Each cell is pushed at most once, so a stack of N cells is always enough
+    parent = np.empty(width * height, dtype=np.int32)
+    stack = np.empty(width * height, dtype=np.int32)
+
+    if not _solve(grid, width, height, start_i, end_i, parent, stack):
+        return None
+
+    # Walk the parents back to the start
+    path = []
+    cur = end_i
+    while cur != -1:
+        path.append(divmod(cur, width))
+        cur = int(parent[cur])
+    path.reverse()
+    return path
@@ -0,0 +1,11 @@
+# Builds the optional C Sudoku solver next to app.py:
+#
+#     python setup.py build_ext --inplace
+#
+# app.py uses it automatically once sudoku_solver is importable.
+from setuptools import Extension, setup
+
+setup(
+    name="dfs-visual-explorer",
+    ext_modules=[Extension("sudoku_solver", ["sudoku_solver.c"])],
+)
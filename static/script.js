@@ -69,18 +69,23 @@ document.addEventListener('DOMContentLoaded', () => {
 
             try {
                 // Send request to Flask backend to solve the puzzle
+                // (profile: true asks the backend to also measure peak memory)
                 const response = await fetch('/generate_and_solve_hanoi', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json'
                     },
-                    body: JSON.stringify({ num_disks: parseInt(numDisks) })
+                    body: JSON.stringify({ num_disks: parseInt(numDisks), profile: true })
                 });
                 const data = await response.json();
+                // Out-of-range disk counts come back as a 400 with an error message
+                if (!response.ok) {
+                    throw new Error(data.error);
+                }
 
                 // Update performance metrics from backend
                 hanoiTimeSpan.textContent = data.time_taken;
-                hanoiMemorySpan.textContent = data.memory_used;
+                hanoiMemorySpan.textContent = data.memory_used || 'n/a'; // null when memory was not measured
 
                 // Animate the solution step by step
                 await animateHanoi(data.solution, pegA, pegB, pegC, hanoiMovesList);
@@ -185,18 +190,19 @@ document.addEventListener('DOMContentLoaded', () => {
 
             try {
                 // Send request to Flask backend to generate and solve puzzle
+                // (profile: true asks the backend to also measure peak memory)
                 const response = await fetch('/generate_and_solve_sudoku', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json'
                     },
-                    body: JSON.stringify({ difficulty: parseInt(difficulty) })
+                    body: JSON.stringify({ difficulty: parseInt(difficulty), profile: true })
                 });
                 const data = await response.json();
 
                 // Update performance metrics from backend
                 sudokuTimeSpan.textContent = data.time_taken;
-                sudokuMemorySpan.textContent = data.memory_used;
+                sudokuMemorySpan.textContent = data.memory_used || 'n/a'; // null when memory was not measured
 
                 // Display the puzzle and solution if successful
                 if (data.success) {
@@ -306,18 +312,19 @@ document.addEventListener('DOMContentLoaded', () => {
 
             try {
                 // Send request to Flask backend to generate and solve maze
+                // (profile: true asks the backend to also measure peak memory)
                 const response = await fetch('/generate_and_solve_maze', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json'
                     },
-                    body: JSON.stringify({ width: parseInt(width), height: parseInt(height) })
+                    body: JSON.stringify({ width: parseInt(width), height: parseInt(height), profile: true })
                 });
                 const data = await response.json();
 
                 // Update performance metrics from backend
                 mazeTimeSpan.textContent = data.time_taken;
-                mazeMemorySpan.textContent = data.memory_used;
+                mazeMemorySpan.textContent = data.memory_used || 'n/a'; // null when memory was not measured
 
                 // Display maze if generated successfully
                 if (data.maze) {
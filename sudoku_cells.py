@@ -0,0 +1,11 @@
+"""
+Cell lookup tables shared by the Sudoku solvers.
+
+The board is stored flat: cell (r, c) lives at index r * 9 + c.
+These tables give the row, column and 3x3 box of every cell index,
+so the solvers never have to recompute divisions inside their hot loops.
+"""
+
+CELL_ROW = tuple(i // 9 for i in range(81))
+CELL_COL = tuple(i % 9 for i in range(81))
+CELL_BOX = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
@@ -0,0 +1,215 @@
+"""
+Numba-compiled version of the Sudoku DFS solver.
+
+This is the same algorithm as solve_sudoku_dfs in app.py (bitmask constraint
+tracking, forced-cell propagation with early dead-end checks, and Minimum
+Remaining Values cell ordering), rewritten against numpy arrays so Numba can
+compile it to native code. Every DFS node then becomes a
+handful of integer operations instead of dozens of Python bytecodes.
+
+Numba and numpy are optional: app.py falls back to the pure Python solver
+when they are not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _popcount(x):
+    # Count set bits by clearing the lowest one until none are left
+    count = 0
+    while x:
+        x &= x - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def _bit_to_digit(bit):
+    # Turn a single set bit (1 << v) back into the digit v
+    v = 0
+    while bit > 1:
+        bit >>= 1
+        v += 1
+    return v
+
+
+@njit(cache=True)
+def _build_masks(board, rows, cols, boxes):
+    """
+    Fills the row/column/box bitmasks and returns (ok, empty cell indices).
+
+    ok is False when the board can't have a solution: a digit given twice in
+    one row, column or box, or an empty cell with no legal digit left.
+    """
+    empties = np.empty(81, dtype=np.int32)
+    n = 0
+    for i in range(81):
+        v = board[i]
+        if v == 0:
+            empties[n] = i
+            n += 1
+        else:
+            r = i // 9
+            c = i % 9
+            b = (r // 3) * 3 + c // 3
+            bit = 1 << v
+            # Already used in this row, column or box: a repeated clue
+            if (rows[r] | cols[c] | boxes[b]) & bit:
+                return False, empties[:0]
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[b] |= bit
+
+    # Every empty cell needs at least one digit that still fits
+    for j in range(n):
+        i = empties[j]
+        r = i // 9
+        c = i % 9
+        if (~(rows[r] | cols[c] | boxes[(r // 3) * 3 + c // 3]) & 0x3FE) == 0:
+            return False, empties[:0]
+
+    return True, empties[:n]
+
+
+@njit(cache=True)
+def _undo(board, rows, cols, boxes, empties, start, stop):
+    # Take back the digits filled into empties[start:stop], newest first
+    for j in range(stop - 1, start - 1, -1):
+        i = empties[j]
+        r = i // 9
+        c = i % 9
+        bit = 1 << board[i]
+        rows[r] ^= bit
+        cols[c] ^= bit
+        boxes[(r // 3) * 3 + c // 3] ^= bit
+        board[i] = 0
+
+
+@njit(cache=True)
+def _solve(board, rows, cols, boxes, empties, k, room):
+    """
+    Recursive DFS over the cells in empties[k:].
+
+    empties[:k] have already been filled. Forced cells are filled first and
+    moved to the front of the unfilled region; then the most constrained
+    remaining cell is swapped to position k, so no Python set is needed.
+    room is a 3 x 9 scratch array for the row/column/box room check.
+    """
+    n = empties.shape[0]
+    start = k
+
+    # PROPAGATE: fill in naked singles until none are left, as
+    # propagate_sudoku does, and give up early on a dead end. The last
+    # sweep also finds the cell with the fewest legal digits (MRV).
+    changed = True
+    best = -1
+    best_cands = 0
+    while changed:
+        changed = False
+        best = -1
+        best_count = 10
+        best_cands = 0
+        for u in range(9):
+            room[0, u] = rows[u]
+            room[1, u] = cols[u]
+            room[2, u] = boxes[u]
+
+        for j in range(k, n):
+            i = empties[j]
+            r = i // 9
+            c = i % 9
+            b = (r // 3) * 3 + c // 3
+            cands = ~(rows[r] | cols[c] | boxes[b]) & 0x3FE
+
+            # No digit fits here: this branch is a dead end
+            if cands == 0:
+                _undo(board, rows, cols, boxes, empties, start, k)
+                return False
+
+            if cands & (cands - 1) == 0:
+                # Exactly one digit fits, so place it
+                board[i] = _bit_to_digit(cands)
+                rows[r] ^= cands
+                cols[c] ^= cands
+                boxes[b] ^= cands
+                empties[j] = empties[k]
+                empties[k] = i
+                k += 1
+                changed = True
+            elif not changed:
+                count = _popcount(cands)
+                if count < best_count:
+                    best = j
+                    best_count = count
+                    best_cands = cands
+                room[0, r] |= cands
+                room[1, c] |= cands
+                room[2, b] |= cands
+
+    # A row, column or box missing a digit that fits none of its empty cells
+    for u in range(9):
+        if room[0, u] & room[1, u] & room[2, u] != 0x3FE:
+            _undo(board, rows, cols, boxes, empties, start, k)
+            return False
+
+    # BASE CASE: every empty cell has a digit
+    if k == n:
+        return True
+
+    # Swap the chosen cell to the front of the unfilled region
+    cell = empties[best]
+    empties[best] = empties[k]
+    empties[k] = cell
+
+    row = cell // 9
+    col = cell % 9
+    box = (row // 3) * 3 + col // 3
+
+    # TRY each legal digit, lowest first
+    candidates = best_cands
+    while candidates:
+        bit = candidates & -candidates
+        candidates ^= bit
+
+        board[cell] = _bit_to_digit(bit)
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+
+        if _solve(board, rows, cols, boxes, empties, k + 1, room):
+            return True
+
+        # BACKTRACK
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+
+    # Reset the cell and undo this level's forced cells too
+    board[cell] = 0
+    _undo(board, rows, cols, boxes, empties, start, k)
+    return False
+
+
+def solve_sudoku(board):
+    """
+    Solves a flat Sudoku board in place with the compiled solver.
+
+    Args:
+        board: Flat bytearray of 81 cells, where 0 represents an empty cell
+
+    Returns:
+        True if puzzle is solved, False if no solution exists
+    """
+    # Zero-copy view of the bytearray, so the solver writes straight into it
+    grid = np.frombuffer(board, dtype=np.uint8)
+    rows = np.zeros(9, dtype=np.int32)
+    cols = np.zeros(9, dtype=np.int32)
+    boxes = np.zeros(9, dtype=np.int32)
+
+    ok, empties = _build_masks(grid, rows, cols, boxes)
+    if not ok:
+        return False
+    room = np.empty((3, 9), dtype=np.int32)
+    return bool(_solve(grid, rows, cols, boxes, empties, 0, room))
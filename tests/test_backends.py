@@ -0,0 +1,142 @@
+"""
+Cross-checks the interchangeable solver backends.
+
+app.py picks whichever Sudoku and maze solvers are available (C extension,
+Numba, pure Python), so every backend that can be imported here must give
+the same answers on the same boards. Backends that are not installed or not
+built are skipped.
+
+Run from the project root with:   python -m pytest
+"""
+
+import random
+
+import pytest
+
+import app
+import sudoku_specialized
+
+# ============================================================================
+# SUDOKU
+# ============================================================================
+
+def solve_python(board):
+    # The pure Python path of app.solve_sudoku, without the dispatch
+    masks = app.build_sudoku_masks(board)
+    if masks is None:
+        return False
+    return app.solve_sudoku_dfs(board, *masks)
+
+SUDOKU_BACKENDS = {
+    "python": solve_python,
+    "specialized": sudoku_specialized.solve_sudoku,
+}
+if app.sudoku_numba is not None:
+    SUDOKU_BACKENDS["numba"] = app.sudoku_numba.solve_sudoku
+if app.sudoku_solver is not None:
+    SUDOKU_BACKENDS["c"] = app.sudoku_solver.solve
+
+def board(text):
+    return bytearray(int(ch) for ch in text)
+
+# Boards with exactly one solution, so every backend must find the same grid
+SOLVABLE_BOARDS = [
+    # Easy: solved by propagation alone
+    "530070000600195000098000060800060003400803001700020006060000280000419005000080079",
+    # Hard: 17 clues, the fewest a uniquely solvable Sudoku can have
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+    # Hard: needs deep search rather than propagation alone
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+]
+
+UNSOLVABLE_BOARDS = [
+    # Duplicate clue: two 5s in the last column
+    "010008000000030000000020000000000000004000005000000600008007000002000005000200000",
+    # Dead cell: the top-left cell sees every digit 1-9 and can take none
+    "012345678900000000000000000000000000000000000000000000000000000000000000000000000",
+]
+
+def is_valid_solution(solved, puzzle):
+    if any(p and p != s for p, s in zip(puzzle, solved)):
+        return False # A clue was changed
+    digits = set(range(1, 10))
+    for i in range(9):
+        row = {solved[i * 9 + c] for c in range(9)}
+        col = {solved[r * 9 + i] for r in range(9)}
+        box = {solved[(i // 3 * 3 + r) * 9 + i % 3 * 3 + c] for r in range(3) for c in range(3)}
+        if row != digits or col != digits or box != digits:
+            return False
+    return True
+
+@pytest.mark.parametrize("text", SOLVABLE_BOARDS)
+def test_sudoku_backends_agree_on_solvable_boards(text):
+    puzzle = board(text)
+    solutions = {}
+    for name, solve in SUDOKU_BACKENDS.items():
+        grid = bytearray(puzzle)
+        assert solve(grid), name
+        assert is_valid_solution(grid, puzzle), name
+        solutions[name] = bytes(grid)
+    assert len(set(solutions.values())) == 1, solutions
+
+@pytest.mark.parametrize("text", UNSOLVABLE_BOARDS)
+def test_sudoku_backends_reject_unsolvable_boards(text):
+    puzzle = board(text)
+    for name, solve in SUDOKU_BACKENDS.items():
+        grid = bytearray(puzzle)
+        assert not solve(grid), name
+        assert grid == puzzle, name # Left untouched on failure
+
+def test_sudoku_backends_agree_on_generated_puzzles():
+    # Blanking cells can leave more than one solution, and not every generated
+    # puzzle is solvable, so only the verdict has to match here
+    rng = random.Random(0)
+    for _ in range(20):
+        puzzle = app.generate_sudoku_puzzle(40, rng)
+        results = set()
+        for name, solve in SUDOKU_BACKENDS.items():
+            grid = bytearray(puzzle)
+            solved = solve(grid)
+            if solved:
+                assert is_valid_solution(grid, puzzle), name
+            results.add(solved)
+        assert len(results) == 1
+
+# ============================================================================
+# MAZE
+# ============================================================================
+
+MAZE_BACKENDS = {"python": app.solve_maze_dfs}
+if app.maze_numba is not None:
+    MAZE_BACKENDS["numba"] = app.maze_numba.solve_maze
+
+def is_valid_path(path, maze, width, start, end):
+    if list(path[0]) != list(start) or list(path[-1]) != list(end):
+        return False
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        if abs(r1 - r2) + abs(c1 - c2) != 1:
+            return False # Not a single step
+    return all(maze[r * width + c] == 0 for r, c in path)
+
+@pytest.mark.parametrize("width, height, seed", [(5, 5, 0), (31, 31, 1), (61, 41, 2), (101, 101, 3)])
+def test_maze_backends_agree(width, height, seed):
+    maze = app.generate_maze(width, height, random.Random(seed))
+    start, end = (1, 1), (height - 2, width - 2)
+    paths = {}
+    for name, solve in MAZE_BACKENDS.items():
+        path = solve(bytearray(maze), width, height, start, end)
+        assert path is not None, name
+        assert is_valid_path(path, maze, width, start, end), name
+        paths[name] = [tuple(p) for p in path]
+    # The generated mazes are perfect (one route between any two cells)
+    assert len({tuple(p) for p in paths.values()}) == 1
+
+def test_maze_backends_report_no_path():
+    width = height = 31
+    maze = app.generate_maze(width, height, random.Random(4))
+    end = (height - 2, width - 2)
+    # Wall the goal in on every side
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        maze[(end[0] + dr) * width + end[1] + dc] = 1
+    for name, solve in MAZE_BACKENDS.items():
+        assert solve(bytearray(maze), width, height, (1, 1), end) is None, name